@@ -9,13 +9,27 @@
 import pandas as pd
 import re
 import chardet
+from pathlib import Path
 
 class KnowledgeGraphConverter:
     """知識圖譜轉換器類別"""
     
+    # 欄狀格式副檔名（直接讀取，不需編碼檢測）
+    PARQUET_EXTENSIONS = ('.parquet', '.pq')
+    FEATHER_EXTENSIONS = ('.feather',)
+    ARROW_EXTENSIONS = ('.arrow', '.ipc')
+    COLUMNAR_EXTENSIONS = PARQUET_EXTENSIONS + FEATHER_EXTENSIONS + ARROW_EXTENSIONS
+    
+    # Parquet 輸出欄位（與 UNWIND 資料的屬性名稱一致）
+    NODE_COLUMNS = ['name', 'educationSystem', 'subject', 'isRoot',
+                    'knowledgeId', 'topic', 'unit', 'concept']
+    RELATIONSHIP_COLUMNS = ['prerequisite', 'target', 'type']
+    
     def __init__(self):
         """初始化轉換器"""
-        pass
+        # 最近一次轉換的正規化資料（供 Parquet 輸出使用）
+        self.nodes_data = []
+        self.relationships_data = []
     
     def detect_encoding(self, file_path):
         """
@@ -87,6 +101,98 @@ class KnowledgeGraphConverter:
             df = pd.read_csv(file_path, encoding='utf-8', errors='ignore')
             return df
     
+    def read_table(self, file_path):
+        """
+        依副檔名讀取資料表
+        
+        Parquet、Feather (V1/V2) 與 Arrow IPC 檔案以記憶體映射直接讀取，
+        不經過編碼檢測；其他檔案一律視為CSV。
+        
+        Args:
+            file_path (str): 資料檔案路徑
+            
+        Returns:
+            pandas.DataFrame: 讀取的資料
+        """
+        suffix = Path(file_path).suffix.lower()
+        
+        if suffix in self.PARQUET_EXTENSIONS:
+            self._import_pyarrow()
+            import pyarrow.parquet as pq
+            table = pq.read_table(file_path, memory_map=True)
+            return table.to_pandas()
+        
+        if suffix in self.FEATHER_EXTENSIONS:
+            self._import_pyarrow()
+            import pyarrow.feather as feather
+            table = feather.read_table(str(file_path), memory_map=True)
+            return table.to_pandas()
+        
+        if suffix in self.ARROW_EXTENSIONS:
+            pa = self._import_pyarrow()
+            with pa.memory_map(str(file_path), 'r') as source:
+                try:
+                    table = pa.ipc.open_file(source).read_all()
+                except pa.ArrowInvalid:
+                    # 不是 IPC 檔案格式，改以串流格式讀取
+                    source.seek(0)
+                    table = pa.ipc.open_stream(source).read_all()
+            return table.to_pandas()
+        
+        return self.read_csv_with_encoding(file_path)
+    
+    def export_nodes_parquet(self, nodes_data, output_path):
+        """
+        將知識點節點資料輸出為Parquet檔案
+        
+        Args:
+            nodes_data (list): 節點屬性字典列表（通常為 self.nodes_data）
+            output_path (str): 輸出檔案路徑
+        """
+        self._write_parquet(nodes_data, self.NODE_COLUMNS, output_path)
+    
+    def export_relationships_parquet(self, relationships_data, output_path):
+        """
+        將先備關係資料輸出為Parquet檔案
+        
+        Args:
+            relationships_data (list): 關係屬性字典列表（通常為 self.relationships_data）
+            output_path (str): 輸出檔案路徑
+        """
+        self._write_parquet(relationships_data, self.RELATIONSHIP_COLUMNS, output_path)
+    
+    def _write_parquet(self, records, columns, output_path):
+        """
+        將記錄列表寫入Parquet檔案
+        
+        所有欄位固定為字串型別，缺少的屬性以空值表示，
+        不同資料集的輸出檔案因此具有相同的結構。
+        
+        Args:
+            records (list): 屬性字典列表
+            columns (list): 輸出欄位順序
+            output_path (str): 輸出檔案路徑
+        """
+        pa = self._import_pyarrow()
+        import pyarrow.parquet as pq
+        schema = pa.schema([(column, pa.string()) for column in columns])
+        table = pa.Table.from_pylist(records, schema=schema)
+        pq.write_table(table, str(output_path))
+    
+    def _import_pyarrow(self):
+        """
+        載入 pyarrow（僅在使用 Parquet/Arrow 功能時需要）
+        
+        Returns:
+            module: pyarrow 模組
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+        except ImportError:
+            raise ImportError("讀寫 Parquet/Arrow 檔案需要 pyarrow，請執行: pip install pyarrow")
+        return pa
+    
     def convert_knowledge_points(self, file_path):
         """
         轉換知識點CSV檔案為Cypher語句
@@ -97,9 +203,12 @@ class KnowledgeGraphConverter:
         Returns:
             str: Cypher語句字串
         """
+        # 清除上一次轉換的資料，避免轉換失敗時沿用舊資料
+        self.nodes_data = []
+        
         try:
-            # 讀取CSV檔案
-            df = self.read_csv_with_encoding(file_path)
+            # 讀取資料檔案（CSV、Parquet 或 Arrow）
+            df = self.read_table(file_path)
             
             # 清理資料
             df = df.dropna(how='all')  # 移除完全空白的列
@@ -231,6 +340,8 @@ class KnowledgeGraphConverter:
                 
                 nodes_data.append(properties)
             
+            self.nodes_data = nodes_data
+            
             # 使用UNWIND批量創建節點
             if nodes_data:
                 # 轉換為Cypher格式的資料
@@ -280,9 +391,12 @@ class KnowledgeGraphConverter:
         Returns:
             str: Cypher語句字串
         """
+        # 清除上一次轉換的資料，避免轉換失敗時沿用舊資料
+        self.relationships_data = []
+        
         try:
-            # 讀取CSV檔案
-            df = self.read_csv_with_encoding(file_path)
+            # 讀取資料檔案（CSV、Parquet 或 Arrow）
+            df = self.read_table(file_path)
             
             # 清理資料
             df = df.dropna(how='all')  # 移除完全空白的列
@@ -352,6 +466,8 @@ class KnowledgeGraphConverter:
                             'type': relationship_type
                         })
             
+            self.relationships_data = relationships_data
+            
             # 使用UNWIND批量創建關係
             if relationships_data:
                 # 轉換為Cypher格式的資料
@@ -424,7 +540,7 @@ class KnowledgeGraphConverter:
         
         try:
             # 驗證知識點檔案
-            df_knowledge = self.read_csv_with_encoding(knowledge_file)
+            df_knowledge = self.read_table(knowledge_file)
             required_knowledge_columns = ['Label', 'Name', 'Education System', 'Subject']
             missing_knowledge = [col for col in required_knowledge_columns if col not in df_knowledge.columns]
             
@@ -433,7 +549,7 @@ class KnowledgeGraphConverter:
                 errors.append(f"知識點檔案缺少必要欄位: {missing_knowledge}")
             
             # 驗證先備關係檔案
-            df_prerequisite = self.read_csv_with_encoding(prerequisite_file)
+            df_prerequisite = self.read_table(prerequisite_file)
             required_prerequisite_columns = ['Types', 'Prerequisite', 'Target']
             missing_prerequisite = [col for col in required_prerequisite_columns if col not in df_prerequisite.columns]
             
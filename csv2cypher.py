@@ -18,12 +18,17 @@ def main():
     print("CSV/Excel 轉 Neo4j Cypher 語句轉換工具")
     print("=" * 60)
     
+    # 解析選項（--parquet: 另外輸出正規化節點與關係的Parquet檔案）
+    export_parquet = '--parquet' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--parquet']
+    
     # 檢查是否有檔案參數
-    if len(sys.argv) < 3:
+    if len(args) < 2:
         print("使用方法:")
-        print("python csv2cypher.py <知識點檔案路徑> <先備關係檔案路徑>")
+        print("python csv2cypher.py <知識點檔案路徑> <先備關係檔案路徑> [--parquet]")
         print("\n範例:")
         print("python csv2cypher.py knowledge_points_EMA.csv Prerequisite_EMA.csv")
+        print("python csv2cypher.py knowledge_points_EMA.parquet Prerequisite_EMA.parquet --parquet")
         print("\n或者直接執行，程式會提示您選擇檔案")
         
         # 顯示可用的檔案
@@ -57,8 +62,8 @@ def main():
             if not prerequisite_file:
                 prerequisite_file = "Prerequisite_EMA.csv"
     else:
-        knowledge_file = sys.argv[1]
-        prerequisite_file = sys.argv[2]
+        knowledge_file = args[0]
+        prerequisite_file = args[1]
     
     # 檢查檔案是否存在
     if not os.path.exists(knowledge_file):
@@ -111,6 +116,17 @@ def main():
                 f.write(prerequisite_cypher)
             print(f"先備關係Cypher語句已儲存至: {prerequisite_output_file}")
         
+        # 儲存正規化節點與關係資料（Parquet）
+        if export_parquet:
+            knowledge_parquet_file = output_dir / f"{knowledge_name}_nodes.parquet"
+            converter.export_nodes_parquet(converter.nodes_data, knowledge_parquet_file)
+            print(f"知識點Parquet資料已儲存至: {knowledge_parquet_file}")
+            
+            if prerequisite_file:
+                prerequisite_parquet_file = output_dir / f"{Path(prerequisite_file).stem}_relationships.parquet"
+                converter.export_relationships_parquet(converter.relationships_data, prerequisite_parquet_file)
+                print(f"先備關係Parquet資料已儲存至: {prerequisite_parquet_file}")
+        
         # 儲存完整Cypher腳本
         if prerequisite_file:
             complete_output_file = output_dir / f"{knowledge_name}_{Path(prerequisite_file).stem}_complete.cypher"
@@ -160,16 +176,18 @@ def main():
         traceback.print_exc()
 
 def list_available_files():
-    """列出可用的檔案組合"""
+    """列出可用的檔案組合（CSV 與 Parquet/Arrow 欄狀格式）"""
     available_files = []
+    extensions = ('.csv',) + KnowledgeGraphConverter.COLUMNAR_EXTENSIONS
     
     # 尋找知識點檔案
-    knowledge_files = [f for f in os.listdir('.') if f.startswith('knowledge_points_') and f.endswith('.csv')]
+    knowledge_files = [f for f in os.listdir('.') if f.startswith('knowledge_points_') and Path(f).suffix.lower() in extensions]
     
     for knowledge_file in knowledge_files:
         # 提取檔案名稱中的類型（EMA, HMA, JMA等）
-        file_type = knowledge_file.replace('knowledge_points_', '').replace('.csv', '')
-        prerequisite_file = f"Prerequisite_{file_type}.csv"
+        suffix = Path(knowledge_file).suffix
+        file_type = Path(knowledge_file).stem.replace('knowledge_points_', '', 1)
+        prerequisite_file = f"Prerequisite_{file_type}{suffix}"
         
         if os.path.exists(prerequisite_file):
             available_files.append((knowledge_file, prerequisite_file))